@@ -1,34 +1,37 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import operator
 from functools import reduce
 
 from django.db.models import Q
 
 
+def _identity(value):
+    return value
+
+
+# operator -> (lookup, coercion of the rule value)
+_COND = {
+    "equal": ("exact", _identity),
+    "begins_with": ("istartswith", _identity),
+    "contains": ("icontains", _identity),
+    "ends_with": ("iendswith", _identity),
+    "less": ("lt", _identity),
+    "less_or_equal": ("lte", _identity),
+    "greater": ("gt", _identity),
+    "greater_or_equal": ("gte", _identity),
+    "between": ("range", tuple),
+}
+
+
 def construct_single_q(rule):
     operator = rule["operator"]
     neg = False
-    if operator.startswith("not_"):
+    if operator[:4] == "not_":
         neg = True
         operator = operator[4:]
 
-    cond = {
-        "equal": "exact",
-        "begins_with": "istartswith",
-        "contains": "icontains",
-        "ends_with": "iendswith",
-        "less": "lt",
-        "less_or_equal": "lte",
-        "greater": "gt",
-        "greater_or_equal": "gte",
-        "between": "range",
-    }[operator]
-
-    if cond != "range":
-        cond_dict = {"{}__{}".format(rule["id"], cond): rule["value"]}
-    else:
-        cond_dict = {"{}__{}".format(rule["id"], cond): tuple(rule["value"])}
+    cond, coerce = _COND[operator]
+    cond_dict = {"{}__{}".format(rule["id"], cond): coerce(rule["value"])}
 
     q_obj = Q(**cond_dict)
 
@@ -46,8 +49,8 @@ def construct_q(filters):
     q_list = [construct_q(rule) for rule in filters["rules"]]
 
     if filters["condition"] == "AND":
-        q_obj = reduce(operator.and_, q_list)
+        q_obj = reduce(Q.__and__, q_list)
     else:
-        q_obj = reduce(operator.or_, q_list)
+        q_obj = reduce(Q.__or__, q_list)
 
     return q_obj
@@ -19,6 +19,7 @@ import json
 import os
 import random
 import re
+import shlex
 import shutil
 
 from data_converters.data_converters import getConverters
@@ -529,6 +530,10 @@ class FrameworkBase(object):
             platform_args["profiler_args"] = test.get("profiler", {})
             platform_args["model_name"] = getModelName(model)
         for idx, cmd in enumerate(cmds):
+            # tokenize once here, runOnPlatform may run the same
+            # command several times until enough iterations are collected
+            if isinstance(cmd, string_types):
+                cmd = shlex.split(cmd)
             # note that we only enable profiling for the last command
             # of the main commands.
             platform_args["enable_profiling"] = (
@@ -13,14 +13,44 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import json
 import os
 import re
-from collections import defaultdict
 
 from frameworks.framework_base import FrameworkBase
 from six import string_types
 
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
+
+
+_LAT_HDR = re.compile(r"(.*)latency per (.*) \[(.*)\]:")
+_LAT_PER = re.compile(r"latency per", re.IGNORECASE)
+_LAT_ROW = re.compile(r"latency\(([^)]+)\): p(\S+): (\S+)", re.IGNORECASE)
+_ABS_HDR = re.compile(r"(.*): (.*) vs (.*)\((.*)\)")
+_ABS_ERR = re.compile(r"abs error", re.IGNORECASE)
+_ABS_ROW = re.compile(r"abs error p(\S+): (\S+)", re.IGNORECASE)
+_IND_LAT = re.compile(r"^individual inference latency \[(\w+)\]: ([0-9]+) us$")
+_REPRO = re.compile(
+    r"(Total inference duration \(ms\)|Avg inference duration \(ms\)"
+    r"|Avg inference per second): (.*)"
+)
+_REPRO_META = {
+    "Total inference duration (ms)": ("Total inference duration", "ms"),
+    "Avg inference duration (ms)": ("Avg inference duration", "scalar"),
+    "Avg inference per second": ("Avg inference per second", "scalar"),
+}
+# (runtime, throughput) column indices of a BenchResult row, per benchmark
+_BENCH_FIELDS = {
+    "AddBench": (10, 11),
+    "BatchGemmBench": (12, 13),
+    "GemmBench": (12, 13),
+    "GemmParallelBench": (11, 12),
+    "SLSBench": (10, 11),
+    "TransposeBench": (11, 12),
+}
+
 
 class GlowFramework(FrameworkBase):
     def __init__(self, tempdir, args):
@@ -68,280 +98,208 @@ class GlowFramework(FrameworkBase):
 
     def runOnPlatform(self, total_num, cmd, platform, platform_args, converter):
         output, meta = platform.runBenchmark(cmd, platform_args=platform_args)
+        rows = output
+        if isinstance(output, string_types):
+            rows = output.splitlines()
         results = {}
-        self._maybeAddJsonOutput(output, results)
         self._maybeAddTraceOutput(platform, results)
-        self._maybeAddBenchSummary(output, results)
-        self._maybeAddNetRunnerStats(output, results)
-        self._maybeNetRunner(output, results)
-        self._maybeRepro(output, results)
+        self._maybeParseRows(rows, results)
         results["meta"] = meta
         return results
 
-    def _maybeRepro(self, output, results):
-        if output is None:
+    def _maybeParseRows(self, rows, results):
+        if rows is None:
             return False
-        rows = output
-        if isinstance(output, string_types):
-            rows = output.split("\n")
-        i = 0
-        while i < len(rows):
-            if "Total inference duration (ms): " in rows[i]:
-                total_inferece_time = float(
-                    rows[i].split("Total inference duration (ms): ")[1]
-                )
-                self._addOrAppendResult(
-                    results,
-                    "Total inference duration",
-                    total_inferece_time,
-                    {
-                        "type": "NET",
-                        "metric": "Total inference duration",
-                        "unit": "ms",
-                        "values": [],
-                    },
-                )
-            if "Avg inference duration (ms): " in rows[i]:
-                avg_inference_time = float(
-                    rows[i].split("Avg inference duration (ms): ")[1]
-                )
-                self._addOrAppendResult(
-                    results,
-                    "Avg inference duration",
-                    avg_inference_time,
-                    {
-                        "type": "NET",
-                        "metric": "Avg inference duration",
-                        "unit": "scalar",
-                        "values": [],
-                    },
-                )
-            if "Avg inference per second: " in rows[i]:
-                avg_inference_per_second = float(
-                    rows[i].split("Avg inference per second: ")[1]
-                )
-                self._addOrAppendResult(
-                    results,
-                    "Avg inference per second",
-                    avg_inference_per_second,
-                    {
-                        "type": "NET",
-                        "metric": "Avg inference per second",
-                        "unit": "scalar",
-                        "values": [],
-                    },
-                )
-            i += 1
+        # metrics printed as json replace any record of the same name,
+        # so they are collected apart and merged in once all rows are seen
+        jsonResults = {}
+        # rows following a "latency per" header belong to it until the
+        # next row mentioning "latency per"
+        latSection = None
+        # rows following an "A vs B" header belong to it as long as they
+        # mention "abs error"
+        absSection = None
+        for row in rows:
+            stripped = row.lstrip()
+            if stripped.startswith("{"):
+                self._addJsonRow(stripped, jsonResults)
+            elif row.startswith("BenchResult,"):
+                self._addBenchRow(row, results)
+            elif row.startswith("individual inference latency ["):
+                match = _IND_LAT.match(row)
+                if match:
+                    self._addNetRunnerStatsRow(match, results)
 
-    def _maybeNetRunner(self, output, results):
-        if output is None:
-            return False
-        rows = output
-        if isinstance(output, string_types):
-            rows = output.split("\n")
-        i = 0
-        while i < len(rows):
-            match = re.search(r"(.*)latency per (.*) \[(.*)\]:", rows[i])
-            if match:
-                if match.group(3) == "glow":
-                    mtype = "NET"
+            if "inference " in row:
+                match = _REPRO.search(row)
+                if match:
+                    self._addReproRow(match, results)
+
+            if latSection is not None:
+                if _LAT_PER.search(row):
+                    latSection = None
                 else:
-                    mtype = "SECONDARY"
-                name = match.group(3)
-                latency_kind = match.group(2)
-                card = match.group(1)
-                if card:
-                    latency_kind = "card " + latency_kind
-                i += 1
-                while i < len(rows) and "latency per" not in rows[i].lower():
-                    match = re.search(
-                        r".*latency\((.*)\): p(.*): (.*)", rows[i].lower()
-                    )
+                    match = _LAT_ROW.search(row)
                     if match:
-                        unit = match.group(1)
-                        percentile = "p" + match.group(2)
-                        value = float(match.group(3))
-
-                        self._addOrAppendResult(
-                            results,
-                            " ".join(
-                                [mtype, name, "net_runner", latency_kind, percentile]
-                            ),
-                            value,
-                            {
-                                "type": mtype,
-                                "metric": " ".join(
-                                    [name, "net_runner", latency_kind, percentile]
-                                ),
-                                "unit": unit,
-                                "values": [],
-                            },
-                        )
-                    i += 1
-            else:
-                i += 1
-
-        i = 0
-        while i < len(rows):
-            match = re.search(r"(.*): (.*) vs (.*)\((.*)\)", rows[i])
-            if match:
-                test_impls1, test_impls2 = sorted([match.group(2), match.group(3)])
-                i += 1
-                while i < len(rows) and "abs error" in rows[i].lower():
-                    match = re.search(r".*abs error p(.*): (.*)", rows[i].lower())
+                        self._addLatencyRow(latSection, match, results)
+            if latSection is None and "latency per" in row:
+                match = _LAT_HDR.search(row)
+                if match:
+                    if match.group(3) == "glow":
+                        mtype = "NET"
+                    else:
+                        mtype = "SECONDARY"
+                    name = match.group(3)
+                    latency_kind = match.group(2)
+                    card = match.group(1)
+                    if card:
+                        latency_kind = "card " + latency_kind
+                    latSection = (mtype, name, latency_kind)
+            if absSection is not None:
+                if _ABS_ERR.search(row):
+                    match = _ABS_ROW.search(row)
                     if match:
-                        percentile = "p" + match.group(1)
-                        value = float(match.group(2))
+                        self._addAbsErrorRow(absSection, match, results)
+                else:
+                    absSection = None
+            if absSection is None and " vs " in row:
+                match = _ABS_HDR.search(row)
+                if match:
+                    absSection = sorted([match.group(2), match.group(3)])
 
-                        self._addOrAppendResult(
-                            results,
-                            " ".join(
-                                [
-                                    "NET",
-                                    test_impls1,
-                                    "vs",
-                                    test_impls2,
-                                    "abs error",
-                                    percentile,
-                                ]
-                            ),
-                            value,
-                            {
-                                "type": "NET",
-                                "metric": " ".join(
-                                    [
-                                        test_impls1,
-                                        "vs",
-                                        test_impls2,
-                                        "abs error",
-                                        percentile,
-                                    ]
-                                ),
-                                "unit": "scalar",
-                                "values": [],
-                            },
-                        )
-                    i += 1
+        for key, parsed in jsonResults.items():
+            if key in results:
+                parsed["values"].extend(results[key]["values"])
+            results[key] = parsed
 
-            else:
-                i += 1
+    def _addReproRow(self, match, results):
+        metric, unit = _REPRO_META[match.group(1)]
+        self._addOrAppendResult(
+            results,
+            metric,
+            float(match.group(2)),
+            {
+                "type": "NET",
+                "metric": metric,
+                "unit": unit,
+                "values": [],
+            },
+        )
 
-    def _maybeAddJsonOutput(self, output, results):
-        if output is None:
-            return False
-        rows = output
-        if isinstance(output, string_types):
-            rows = output.split("\n")
-        i = 0
-        while i < len(rows):
-            try:
-                parsed = json.loads(rows[i])
-                results[parsed["type"] + " " + parsed["metric"]] = parsed
-            except json.JSONDecodeError:
-                pass
-            i += 1
+    def _addLatencyRow(self, section, match, results):
+        mtype, name, latency_kind = section
+        unit = match.group(1).lower()
+        percentile = "p" + match.group(2).lower()
+        value = float(match.group(3))
 
-    def _addOrAppendResult(self, results, key, value, record):
-        if key not in results.keys():
-            results[key] = record
-        results[key]["values"].append(value)
+        self._addOrAppendResult(
+            results,
+            " ".join([mtype, name, "net_runner", latency_kind, percentile]),
+            value,
+            {
+                "type": mtype,
+                "metric": " ".join([name, "net_runner", latency_kind, percentile]),
+                "unit": unit,
+                "values": [],
+            },
+        )
 
-    def _maybeAddBenchSummary(self, output, results):
-        existingMaps = {
-            "AddBench": (10, 11),
-            "BatchGemmBench": (12, 13),
-            "GemmBench": (12, 13),
-            "GemmParallelBench": (11, 12),
-            "SLSBench": (10, 11),
-            "TransposeBench": (11, 12),
-        }
+    def _addAbsErrorRow(self, impls, match, results):
+        test_impls1, test_impls2 = impls
+        percentile = "p" + match.group(1).lower()
+        value = float(match.group(2))
 
-        fieldMap = defaultdict(lambda: (10, 11))
-        for k in existingMaps:
-            fieldMap[k] = existingMaps[k]
+        self._addOrAppendResult(
+            results,
+            " ".join(["NET", test_impls1, "vs", test_impls2, "abs error", percentile]),
+            value,
+            {
+                "type": "NET",
+                "metric": " ".join(
+                    [test_impls1, "vs", test_impls2, "abs error", percentile]
+                ),
+                "unit": "scalar",
+                "values": [],
+            },
+        )
 
-        if output is None:
-            return False
-        rows = output
-        if isinstance(output, string_types):
-            rows = output.split("\n")
-        i = 0
-        while i < len(rows):
-            try:
-                fields = rows[i].split(",")
-                if fields[0] == "BenchResult":
-                    benchName = fields[1]
+    def _addJsonRow(self, row, results):
+        try:
+            parsed = _jloads(row)
+            results[parsed["type"] + " " + parsed["metric"]] = parsed
+        except ValueError:
+            pass
 
-                    runtimeRecord = {
-                        "type": "NET",
-                        "metric": "{}:runtime".format(benchName),
-                        "unit": "second",
-                        "values": [],
-                    }
-                    throughputRecord = {
-                        "type": "SECONDARY",
-                        "metric": "{}:throughput".format(benchName),
-                        "unit": "Gb/second",
-                        "values": [],
-                    }
+    def _addOrAppendResult(self, results, key, value, record):
+        results.setdefault(key, record)["values"].append(value)
 
-                    self._addOrAppendResult(
-                        results,
-                        "NET {}:runtime".format(benchName),
-                        float(fields[fieldMap[benchName][0]]),
-                        runtimeRecord,
-                    )
-                    self._addOrAppendResult(
-                        results,
-                        "SECONDARY {}:throughput".format(benchName),
-                        float(fields[fieldMap[benchName][1]]),
-                        throughputRecord,
-                    )
+    def _addBenchRow(self, row, results):
+        try:
+            fields = row.split(",")
+            benchName = fields[1]
+            runtimeField, throughputField = _BENCH_FIELDS.get(benchName, (10, 11))
 
-            except IndexError:
-                pass
-            except ValueError:
-                pass
-            i += 1
+            runtimeRecord = {
+                "type": "NET",
+                "metric": "{}:runtime".format(benchName),
+                "unit": "second",
+                "values": [],
+            }
+            throughputRecord = {
+                "type": "SECONDARY",
+                "metric": "{}:throughput".format(benchName),
+                "unit": "Gb/second",
+                "values": [],
+            }
 
-    def _maybeAddNetRunnerStats(self, output, results):
-        if output is None:
-            return False
-        rows = output
-        if isinstance(output, string_types):
-            rows = output.split("\n")
-        i = 0
-        while i < len(rows):
-            m = re.match(
-                r"^individual inference latency \[(\w+)\]: ([0-9]+) us$", rows[i]
+            self._addOrAppendResult(
+                results,
+                "NET {}:runtime".format(benchName),
+                float(fields[runtimeField]),
+                runtimeRecord,
             )
-            if m:
-                if m.groups()[0] == "glow":
-                    mtype = "NET"
-                else:
-                    mtype = "SECONDARY"
-                self._addOrAppendResult(
-                    results,
-                    mtype + " " + m.groups()[0] + " net_runner inference",
-                    int(m.groups()[1]),
-                    {
-                        "type": mtype,
-                        "metric": m.groups()[0] + " net_runner inference",
-                        "unit": "microsecond",
-                        "values": [],
-                    },
-                )
-            i += 1
+            self._addOrAppendResult(
+                results,
+                "SECONDARY {}:throughput".format(benchName),
+                float(fields[throughputField]),
+                throughputRecord,
+            )
+
+        except IndexError:
+            pass
+        except ValueError:
+            pass
+
+    def _addNetRunnerStatsRow(self, m, results):
+        name = m.group(1)
+        if name == "glow":
+            mtype = "NET"
+        else:
+            mtype = "SECONDARY"
+        self._addOrAppendResult(
+            results,
+            mtype + " " + name + " net_runner inference",
+            int(m.group(2)),
+            {
+                "type": mtype,
+                "metric": name + " net_runner inference",
+                "unit": "microsecond",
+                "values": [],
+            },
+        )
 
     def _maybeAddTraceOutput(self, platform, results):
         traceFile = os.path.join(platform.getOutputDir(), "trace")
         if not os.path.exists(traceFile):
             return
-        with open(traceFile, "r") as fp:
-            line = fp.readline()
-            while line:
+        # both json and orjson parse bytes directly, so skip decoding
+        with open(traceFile, "rb") as fp:
+            for line in fp:
+                line = line.lstrip()
+                if not line.startswith(b"{"):
+                    continue
                 try:
-                    parsed = json.loads(line.rstrip(", \n\t"))
+                    parsed = _jloads(line.rstrip(b", \r\n\t"))
                     metric = parsed["name"]
                     if not metric:
                         raise ValueError("empty metric")
@@ -361,10 +319,7 @@ class GlowFramework(FrameworkBase):
                             "values": [],
                         },
                     )
-                except json.JSONDecodeError:
-                    pass
                 except KeyError:
                     pass
                 except ValueError:
                     pass
-                line = fp.readline()
@@ -21,6 +21,9 @@ from six import string_types
 from utils.custom_logger import getLogger
 from utils.utilities import getRunStatus, setRunStatus
 
+_PS_PID = re.compile(r"^shell\s+(\d+)\s+")
+_PROP = re.compile(r"^\[(.+?)\]: \[(.*)$")
+
 
 class AndroidPlatform(PlatformBase):
     def __init__(self, tempdir, adb, args, usb_controller=None):
@@ -32,22 +35,17 @@ class AndroidPlatform(PlatformBase):
             args.device_name_mapping,
         )
         self.args = args
-        self.rel_version = adb.shell(
-            ["getprop", "ro.build.version.release"], default=""
-        )[0].strip()
-        self.build_version = adb.shell(["getprop", "ro.build.version.sdk"], default="")[
-            0
-        ].strip()
+        self.props = self._getProps(adb)
+        self.rel_version = self.props.get("ro.build.version.release", "").strip()
+        self.build_version = self.props.get("ro.build.version.sdk", "").strip()
         platform = (
-            adb.shell(["getprop", "ro.product.model"], default="")[0].strip()
+            self.props.get("ro.product.model", "").strip()
             + "-"
             + self.rel_version
             + "-"
             + self.build_version
         )
-        self.platform_abi = adb.shell(["getprop ro.product.cpu.abi"], default="")[
-            0
-        ].strip()
+        self.platform_abi = self.props.get("ro.product.cpu.abi", "").strip()
         self.os_version = "{}-{}".format(self.rel_version, self.build_version)
         self.type = "android"
         self.setPlatform(platform)
@@ -55,9 +53,30 @@ class AndroidPlatform(PlatformBase):
         self.usb_controller = usb_controller
         self._setLogCatSize()
         self.app = None
+        self.app_patterns = []
         if self.args.set_freq:
             self.util.setFrequency(self.args.set_freq)
 
+    def _getProps(self, adb):
+        # a bare getprop dumps every property as "[key]: [value]", which
+        # is a single adb round trip instead of one per property
+        props = {}
+        key = None
+        for line in adb.shell(["getprop"], default=[]):
+            if key is None:
+                match = _PROP.match(line)
+                if not match:
+                    continue
+                key = match.group(1)
+                value = [match.group(2)]
+            else:
+                # a value containing newlines continues on the next lines
+                value.append(line)
+            if value[-1].endswith("]"):
+                props[key] = "\n".join(value)[:-1]
+                key = None
+        return props
+
     def getKind(self):
         if self.platform_model and self.platform_os_version:
             return "{}-{}".format(self.platform_model, self.platform_os_version)
@@ -82,20 +101,21 @@ class AndroidPlatform(PlatformBase):
 
     def fileExistsOnPlatform(self, files):
         if isinstance(files, string_types):
-            exists = self.util.shell(
-                "test -e {} && echo True || echo False".format(files).split(" ")
+            files = [files]
+        elif not isinstance(files, list):
+            raise TypeError(
+                "fileExistsOnPlatform takes either a string or list of strings."
             )
-            if "True" not in exists:
-                return False
+        if len(files) == 0:
             return True
-        elif isinstance(files, list):
-            for f in files:
-                if not self.fileExistsOnPlatform(f):
-                    return False
-            return True
-        raise TypeError(
-            "fileExistsOnPlatform takes either a string or list of strings."
+        # check all files in one round trip, ls only prints the ones that exist
+        cmd = (
+            ["ls", "-1d", "--"]
+            + [shlex.quote(f) for f in files]
+            + ["2>/dev/null", "||", "true"]
         )
+        present = {line.strip() for line in self.util.shell(cmd)}
+        return all(f in present for f in files)
 
     def preprocess(self, *args, **kwargs):
         assert "programs" in kwargs, "Must have programs specified"
@@ -120,6 +140,14 @@ class AndroidPlatform(PlatformBase):
             else:
                 return
 
+        # logcat patterns that mark the end of an app benchmark run
+        package_re = re.escape(self.app["package"])
+        activity_re = re.escape(self.app["activity"])
+        self.app_patterns = [
+            re.compile(r".*{}.*{}.*BENCHMARK_DONE".format(package_re, activity_re)),
+            re.compile(r".*ActivityManager: Killing .*{}".format(package_re)),
+        ]
+
         # Uninstall if exist
         package = self.util.shell(["pm", "list", "packages", self.app["package"]])
         if len(package) > 0 and package[0].strip() == "package:" + self.app["package"]:
@@ -145,7 +173,8 @@ class AndroidPlatform(PlatformBase):
             self.util.setFrequency(self.args.set_freq)
 
     def runBenchmark(self, cmd, *args, **kwargs):
-        if not isinstance(cmd, list):
+        if isinstance(cmd, string_types):
+            # frameworks already pass a tokenized list
             cmd = shlex.split(cmd)
 
         # meta is used to store any data about the benchmark run
@@ -166,38 +195,28 @@ class AndroidPlatform(PlatformBase):
     def runAppBenchmark(self, cmd, *args, **kwargs):
         arguments = self.getPairedArguments(cmd)
         argument_filename = os.path.join(self.tempdir, "benchmark.json")
-        arguments_json = json.dumps(arguments, indent=2, sort_keys=True)
+        arguments_json = json.dumps(arguments, separators=(",", ":"), sort_keys=True)
         with open(argument_filename, "w") as f:
             f.write(arguments_json)
         tgt_argument_filename = os.path.join(self.tgt_dir, "benchmark.json")
         activity = os.path.join(self.app["package"], self.app["activity"])
         self.util.push(argument_filename, tgt_argument_filename)
         platform_args = {}
+        meta = {}
         if "platform_args" in kwargs:
             platform_args = kwargs["platform_args"]
             if "power" in platform_args and platform_args["power"]:
                 platform_args["non_blocking"] = True
                 self.util.shell(["am", "start", "-S", activity])
-                return []
+                return [], meta
             if platform_args.get("enable_profiling", False):
                 getLogger().warn("Profiling for app benchmarks is not implemented.")
 
-        patterns = []
-        pattern = re.compile(
-            r".*{}.*{}.*BENCHMARK_DONE".format(
-                self.app["package"], self.app["activity"]
-            )
-        )
-        patterns.append(pattern)
-        pattern = re.compile(
-            r".*ActivityManager: Killing .*{}".format(self.app["package"])
-        )
-        patterns.append(pattern)
-        platform_args["patterns"] = patterns
+        platform_args["patterns"] = self.app_patterns
         self.util.shell(["am", "start", "-S", "-W", activity])
         log_logcat = self.util.run(["logcat"], **platform_args)
         self.util.shell(["am", "force-stop", self.app["package"]])
-        return log_logcat
+        return log_logcat, meta
 
     def runBinaryBenchmark(self, cmd, *args, **kwargs):
         log_to_screen_only = (
@@ -266,17 +285,24 @@ class AndroidPlatform(PlatformBase):
 
     def killProgram(self, program):
         basename = os.path.basename(program)
-        # if the program doesn't exist, the grep may fail
+        # if the program doesn't exist, pgrep or grep may fail
         # do not update status code
         success = getRunStatus()
+        res = self.util.shell(["pgrep", "-u", "shell", "-x", basename], retry=1)
+        setRunStatus(success, overwrite=True)
+        pids = [pid for line in res for pid in line.split() if pid.isdigit()]
+        if pids:
+            self.util.shell(["kill"] + pids, retry=1)
+            return
+
+        # pgrep is missing on older devices, fall back to scanning ps
         res = self.util.shell(["ps", "|", "grep", basename])
         setRunStatus(success, overwrite=True)
         if len(res) == 0:
             return
         results = res[0].split("\n")
-        pattern = re.compile(r"^shell\s+(\d+)\s+")
         for result in results:
-            match = pattern.match(result)
+            match = _PS_PID.match(result)
             if match:
                 pid = match.group(1)
                 self.util.shell(["kill", pid])
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright 2017-present, Facebook, Inc.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+##############################################################################
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+BENCHMARK_DIR = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.realpath(__file__)), os.pardir, os.pardir, os.pardir
+    )
+)
+sys.path.append(BENCHMARK_DIR)
+
+from frameworks.glow.glow import GlowFramework
+
+OUTPUT = """junk line
+Total inference duration (ms): 12.5
+Avg inference duration (ms): 1.25
+Avg inference per second: 800
+individual inference latency [glow]: 123 us
+individual inference latency [tvm]: 45 us
+card0 latency per batch [glow]:
+  latency(us): p50: 10.5
+  Latency(US): P90: 20
+unrelated row inside the section
+latency per run [tvm]:
+latency(ms): p99: 3.25
+foo: interp vs glow(cpu)
+  abs error p50: 0.1
+  ABS ERROR P99: 0.2
+end of abs error rows
+BenchResult,AddBench,a,b,c,d,e,f,g,h,1.5,2.5
+BenchResult,GemmBench,a,b,c,d,e,f,g,h,i,j,3.0,4.0
+BenchResult,NewBench,a,b,c,d,e,f,g,h,5,6
+BenchResult,short
+{"type": "NET", "metric": "AddBench:runtime", "unit": "s", "values": [9]}
+"""
+
+TRACE = """[
+{"name": "inference_e2e", "dur": 5},
+{"name": "op", "dur": 3},
+{"name": "", "dur": 1},
+  {"name": "op", "dur": 4}
+]
+"""
+
+
+class StubPlatform(object):
+    def __init__(self, output, output_dir):
+        self.output = output
+        self.output_dir = output_dir
+
+    def runBenchmark(self, cmd, *args, **kwargs):
+        return self.output, {"meta": "data"}
+
+    def getOutputDir(self):
+        return self.output_dir
+
+
+class GlowFrameworkTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp(prefix="aibench")
+        self.framework = GlowFramework(self.tempdir, argparse.Namespace())
+        with open(os.path.join(self.tempdir, "trace"), "w") as f:
+            f.write(TRACE)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir, True)
+
+    def _run(self, output):
+        platform = StubPlatform(output, self.tempdir)
+        return self.framework.runOnPlatform(1, [], platform, {}, None)
+
+    def _values(self, results):
+        return {key: value["values"] for key, value in results.items() if key != "meta"}
+
+    def test_run_on_platform(self):
+        results = self._run(OUTPUT)
+        self.assertEqual(results["meta"], {"meta": "data"})
+        self.assertEqual(
+            self._values(results),
+            {
+                "Total inference duration": [12.5],
+                "Avg inference duration": [1.25],
+                "Avg inference per second": [800.0],
+                "NET glow net_runner inference": [123],
+                "SECONDARY tvm net_runner inference": [45],
+                "NET glow net_runner card batch p50": [10.5],
+                "NET glow net_runner card batch p90": [20.0],
+                "SECONDARY tvm net_runner run p99": [3.25],
+                "NET glow vs interp abs error p50": [0.1],
+                "NET glow vs interp abs error p99": [0.2],
+                "NET AddBench:runtime": [9, 1.5],
+                "SECONDARY AddBench:throughput": [2.5],
+                "NET GemmBench:runtime": [3.0],
+                "SECONDARY GemmBench:throughput": [4.0],
+                "NET NewBench:runtime": [5.0],
+                "SECONDARY NewBench:throughput": [6.0],
+                "NET inference_e2e": [5],
+                "SECONDARY op": [3, 4],
+            },
+        )
+        self.assertEqual(results["NET glow net_runner card batch p90"]["unit"], "us")
+        self.assertEqual(results["SECONDARY tvm net_runner run p99"]["unit"], "ms")
+        # the json record replaces the one created for the BenchResult row
+        self.assertEqual(results["NET AddBench:runtime"]["unit"], "s")
+        self.assertEqual(results["Total inference duration"]["unit"], "ms")
+
+    def test_run_on_platform_with_list_output(self):
+        self.assertEqual(
+            self._values(self._run(OUTPUT.split("\n"))),
+            self._values(self._run(OUTPUT)),
+        )
+
+    def test_run_on_platform_without_output(self):
+        results = self._run(None)
+        self.assertEqual(
+            self._values(results),
+            {"NET inference_e2e": [5], "SECONDARY op": [3, 4]},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+##############################################################################
+# Copyright 2017-present, Facebook, Inc.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+##############################################################################
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import shlex
+import sys
+import tempfile
+import unittest
+
+from mock import patch
+
+BENCHMARK_DIR = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.realpath(__file__)), os.pardir, os.pardir, os.pardir
+    )
+)
+sys.path.append(BENCHMARK_DIR)
+
+from platforms.android.adb import ADB
+from platforms.android.android_platform import AndroidPlatform
+
+
+class AndroidPlatformTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp(prefix="aibench")
+        self.platform = self._createPlatform([])
+
+    def _createPlatform(self, getprop_output):
+        adb = ADB("123456789", self.tempdir)
+        args = argparse.Namespace(
+            android_dir="/data/local/tmp/",
+            hash_platform_mapping=None,
+            device_name_mapping=None,
+            set_freq=None,
+        )
+        with patch(
+            "platforms.android.adb.ADB.shell", return_value=getprop_output
+        ) as shell, patch("platforms.android.adb.ADB.logcat", return_value=[]):
+            platform = AndroidPlatform(self.tempdir, adb, args)
+        # all properties are read with a single getprop call
+        shell.assert_called_once_with(["getprop"], default=[])
+        return platform
+
+    def test_props(self):
+        platform = self._createPlatform(
+            [
+                "[dalvik.vm.heapsize]: [512m]",
+                "[persist.sys.banner]: [first line",
+                "second line]",
+                "[ro.build.version.release]: [11]",
+                "[ro.build.version.sdk]: [30]",
+                "[ro.product.cpu.abi]: [arm64-v8a]",
+                "[ro.product.model]: [Pixel 5]",
+            ]
+        )
+        self.assertEqual(platform.rel_version, "11")
+        self.assertEqual(platform.build_version, "30")
+        self.assertEqual(platform.platform_abi, "arm64-v8a")
+        self.assertEqual(platform.platform, "Pixel-5-11-30")
+        self.assertEqual(
+            platform.props["persist.sys.banner"], "first line\nsecond line"
+        )
+        self.assertEqual(platform.props["dalvik.vm.heapsize"], "512m")
+
+    def test_props_missing_key(self):
+        platform = self._createPlatform(
+            [
+                "[ro.build.version.release]: [9]",
+                "[ro.build.version.sdk]: [28]",
+                "[ro.product.model]: [SM-G960F]",
+            ]
+        )
+        self.assertEqual(platform.rel_version, "9")
+        self.assertEqual(platform.build_version, "28")
+        self.assertEqual(platform.platform_abi, "")
+        self.assertEqual(platform.platform, "SM-G960F-9-28")
+
+    def _ls(self, existing):
+        def shell(cmd, **kwargs):
+            # emulate the device shell: unquote the joined command and let
+            # ls print only the paths that exist
+            tokens = shlex.split(" ".join(cmd))
+            self.assertEqual(tokens[:3], ["ls", "-1d", "--"])
+            paths = tokens[3 : tokens.index("2>/dev/null")]
+            return [p for p in paths if p in existing]
+
+        return shell
+
+    def test_file_exists_on_platform(self):
+        existing = {"/data/local/tmp/a", "/data/local/tmp/b", "/data/local/tmp/c d"}
+        with patch.object(
+            self.platform.util, "shell", side_effect=self._ls(existing)
+        ) as shell:
+            self.assertTrue(
+                self.platform.fileExistsOnPlatform(
+                    ["/data/local/tmp/a", "/data/local/tmp/b"]
+                )
+            )
+            self.assertFalse(
+                self.platform.fileExistsOnPlatform(
+                    ["/data/local/tmp/a", "/data/local/tmp/missing"]
+                )
+            )
+            self.assertTrue(
+                self.platform.fileExistsOnPlatform(
+                    ["/data/local/tmp/a", "/data/local/tmp/c d"]
+                )
+            )
+            self.assertFalse(self.platform.fileExistsOnPlatform(["/data/local/tmp/c"]))
+            self.assertTrue(self.platform.fileExistsOnPlatform("/data/local/tmp/b"))
+            self.assertFalse(
+                self.platform.fileExistsOnPlatform("/data/local/tmp/missing")
+            )
+            # one adb round trip per call, whatever the number of files
+            self.assertEqual(shell.call_count, 6)
+
+    def test_file_exists_on_platform_type_error(self):
+        with self.assertRaises(TypeError):
+            self.platform.fileExistsOnPlatform(None)
+
+    def test_kill_program(self):
+        with patch.object(
+            self.platform.util, "shell", side_effect=[["123", "456"], []]
+        ) as shell:
+            self.platform.killProgram("/data/local/tmp/benchmark")
+        self.assertEqual(
+            shell.call_args_list[0][0][0],
+            ["pgrep", "-u", "shell", "-x", "benchmark"],
+        )
+        shell.assert_called_with(["kill", "123", "456"], retry=1)
+        self.assertEqual(shell.call_count, 2)
+
+    def test_kill_program_without_pgrep(self):
+        with patch.object(
+            self.platform.util,
+            "shell",
+            side_effect=[
+                ["/system/bin/sh: pgrep: not found"],
+                ["shell     789   1 benchmark"],
+                [],
+            ],
+        ) as shell:
+            self.platform.killProgram("/data/local/tmp/benchmark")
+        self.assertEqual(
+            shell.call_args_list[1][0][0], ["ps", "|", "grep", "benchmark"]
+        )
+        shell.assert_called_with(["kill", "789"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,7 +20,13 @@ BENCHMARK_DIR = os.path.abspath(
 )
 sys.path.append(BENCHMARK_DIR)
 
-from utils.build_program import buildUsingBuck, _setUpTempDirectory, _isBuildSuccessful
+from utils.build_program import (
+    buildUsingBuck,
+    getBuildScript,
+    _loadBinaryResource,
+    _setUpTempDirectory,
+    _isBuildSuccessful,
+)
 
 
 class BuildProgramTest(unittest.TestCase):
@@ -51,6 +57,46 @@ class BuildProgramTest(unittest.TestCase):
             _isBuildSuccessful(self.actual_file, "oculus", "buck build aibench:run")
         )
 
+    def testGetBuildScriptFromPath(self):
+        frameworks_dir = os.path.join(gettempdir(), "aibenchtest3")
+        framework_script = os.path.join(frameworks_dir, "glow", "build.sh")
+        platform_script = os.path.join(frameworks_dir, "glow", "android", "build.sh")
+        _setUpTempDirectory(platform_script)
+        if os.path.isfile(platform_script):
+            os.remove(platform_script)
+        with open(framework_script, "a"):
+            os.utime(framework_script, None)
+        self.assertEqual(
+            getBuildScript("glow", frameworks_dir, "android", self.fake_file),
+            framework_script,
+        )
+        # the lookup on disk is not cached, a new platform script is found
+        with open(platform_script, "a"):
+            os.utime(platform_script, None)
+        self.assertEqual(
+            getBuildScript("glow", frameworks_dir, "android", self.fake_file),
+            platform_script,
+        )
+
+    def testGetBuildScriptFromBinaryCached(self):
+        _loadBinaryResource.cache_clear()
+        with patch(
+            "pkg_resources.resource_exists", return_value=True
+        ) as resource_exists, patch(
+            "pkg_resources.resource_string", return_value=b"echo build"
+        ) as resource_string:
+            for _ in range(2):
+                build_script = getBuildScript("glow", None, "android", self.fake_file)
+                self.assertEqual(
+                    build_script,
+                    os.path.join(os.path.dirname(self.fake_file), "build.sh"),
+                )
+                with open(build_script) as f:
+                    self.assertEqual(f.read(), "echo build")
+        self.assertEqual(resource_exists.call_count, 1)
+        self.assertEqual(resource_string.call_count, 1)
+        _loadBinaryResource.cache_clear()
+
 
 if __name__ == "__main__":
     unittest.main()
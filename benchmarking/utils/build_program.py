@@ -14,6 +14,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import os
+from functools import lru_cache
 
 import pkg_resources
 
@@ -124,11 +125,11 @@ def _readFromBinary(framework, frameworks_dir, platform, dst):
     script_path = os.path.join(
         "specifications/frameworks", framework, platform, "build.sh"
     )
-    if not pkg_resources.resource_exists("aibench", script_path):
+    raw_build_script = _loadBinaryResource(script_path)
+    if raw_build_script is None:
         raise Exception(
             "cannot find the build script in the binary under {}.".format(script_path)
         )
-    raw_build_script = pkg_resources.resource_string("aibench", script_path)
     if not os.path.exists(os.path.dirname(dst)):
         os.makedirs(os.path.dirname(dst))
     with open(os.path.join(os.path.dirname(dst), "build.sh"), "w") as f:
@@ -136,3 +137,13 @@ def _readFromBinary(framework, frameworks_dir, platform, dst):
     build_script = f.name
 
     return build_script
+
+
+@lru_cache(maxsize=None)
+def _loadBinaryResource(script_path):
+    # The resources packaged in the binary cannot change while it runs, so
+    # both hits and misses are cached. Scripts looked up on disk are not,
+    # the tree may change between the commits repo_driver builds.
+    if not pkg_resources.resource_exists("aibench", script_path):
+        return None
+    return pkg_resources.resource_string("aibench", script_path)